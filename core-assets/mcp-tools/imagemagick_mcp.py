@@ -1,11 +1,65 @@
 import sys
 import json
+import shutil
 import subprocess
+from typing import Optional
+
+# Resolve the ImageMagick entry point once at import time: prefer the
+# ImageMagick 7 'magick' binary, fall back to the v6 'convert' shim.
+# Avoids a PATH search on every request.
+MAGICK_BIN = shutil.which('magick') or shutil.which('convert') or 'convert'
+
+# Prefer orjson for the per-request encode/decode; fall back to stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes line, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# msgspec decodes straight into a typed Struct, skipping the generic
+# dict build and validating the request shape inline. Optional, with
+# the orjson/stdlib path as fallback.
+try:
+    import msgspec
+
+    class Request(msgspec.Struct):
+        method: Optional[str] = None
+        params: dict = msgspec.field(default_factory=dict)
+
+    _request_decoder = msgspec.json.Decoder(Request)
+except ImportError:
+    msgspec = None
+
+
+def _parse_request(line):
+    """Parse one request line into (method, params)."""
+    if msgspec is not None:
+        request = _request_decoder.decode(line)
+        return request.method, request.params
+    request = _json_loads(line)
+    return request.get('method'), request.get('params', {})
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 bytes, ready to write to stdout."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
 
 def run_command(command):
     """Executes a subprocess command and returns a structured response."""
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True)
+        # close_fds=False skips the close-every-descriptor loop that
+        # dominates spawn cost for these short-lived processes
+        result = subprocess.run(command, capture_output=True, text=True, check=True,
+                                close_fds=False)
         return {
             "success": True,
             "stdout": result.stdout,
@@ -37,7 +91,7 @@ def create_image(params):
         return {"success": False, "error": "Missing required parameter: output"}
 
     command = [
-        'convert',
+        MAGICK_BIN,
         '-size', f'{width}x{height}',
         f'xc:{color}',
         output_file
@@ -50,16 +104,14 @@ def convert_image(params):
     if not args or not isinstance(args, list):
         return {"success": False, "error": "Missing or invalid 'args' parameter. It must be a list of strings."}
 
-    command = ['convert'] + args
+    command = [MAGICK_BIN] + args
     return run_command(command)
 
 def main():
     """Main loop to handle MCP requests."""
     for line in sys.stdin:
         try:
-            request = json.loads(line)
-            method = request.get('method')
-            params = request.get('params', {})
+            method, params = _parse_request(line)
 
             response = {}
             if method == 'create':
@@ -69,16 +121,17 @@ def main():
             else:
                 response['error'] = f"Unknown method: {method}. Available methods: 'create', 'convert'."
 
-            sys.stdout.write(json.dumps(response) + '\n')
-            sys.stdout.flush()
-        except json.JSONDecodeError:
+            # Write raw bytes to skip the text-layer UTF-8 re-encode
+            sys.stdout.buffer.write(_json_dumps(response) + b'\n')
+            sys.stdout.buffer.flush()
+        except ValueError:
             error_response = {"error": "Invalid JSON received"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
         except Exception as e:
             error_response = {"error": f"An unexpected error occurred: {str(e)}"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -11,6 +11,26 @@ import tempfile
 import os
 from pathlib import Path
 
+# Prefer orjson for the per-request encode/decode; fall back to stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes line, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 bytes, ready to write to stdout."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 def run_kicad_cli(params):
     """Execute KiCad CLI commands."""
     command = params.get('command')
@@ -197,7 +217,7 @@ def main():
     """Main loop to handle MCP requests."""
     for line in sys.stdin:
         try:
-            request = json.loads(line)
+            request = _json_loads(line)
             response = {}
 
             method = request.get('method')
@@ -212,17 +232,18 @@ def main():
             else:
                 response['error'] = f"Unknown method: {method}"
 
-            sys.stdout.write(json.dumps(response) + '\n')
-            sys.stdout.flush()
+            # Write raw bytes to skip the text-layer UTF-8 re-encode
+            sys.stdout.buffer.write(_json_dumps(response) + b'\n')
+            sys.stdout.buffer.flush()
 
-        except json.JSONDecodeError:
+        except ValueError:
             error_response = {"error": "Invalid JSON received"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
         except Exception as e:
             error_response = {"error": f"An unexpected error occurred: {str(e)}"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
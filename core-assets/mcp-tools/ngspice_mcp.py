@@ -4,6 +4,26 @@ import subprocess
 import tempfile
 import os
 
+# Prefer orjson for the per-request encode/decode; fall back to stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes line, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 bytes, ready to write to stdout."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 def run_ngspice(params):
     """Executes an NGSpice simulation from a netlist."""
     netlist = params.get('netlist')
@@ -47,7 +67,7 @@ def main():
     """Main loop to handle MCP requests."""
     for line in sys.stdin:
         try:
-            request = json.loads(line)
+            request = _json_loads(line)
             # This is a simple example. A real implementation would have more robust
             # request validation and dispatching based on 'method' or 'tool' field.
             # For now, we assume any request is for run_ngspice.
@@ -64,18 +84,19 @@ def main():
             else:
                 response['error'] = f"Unknown method: {method}"
 
-            sys.stdout.write(json.dumps(response) + '\n')
-            sys.stdout.flush()
-        except json.JSONDecodeError:
+            # Write raw bytes to skip the text-layer UTF-8 re-encode
+            sys.stdout.buffer.write(_json_dumps(response) + b'\n')
+            sys.stdout.buffer.flush()
+        except ValueError:
             # Handle cases where the line is not valid JSON
             error_response = {"error": "Invalid JSON received"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
         except Exception as e:
             # Catch other unexpected errors during request processing
             error_response = {"error": f"An unexpected error occurred: {str(e)}"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Reads JSON requests from stdin, sends them to the PBR Generator via TCP, and pri
 import sys
 import json
 import socket
+import struct
 import os
 import logging
 
@@ -34,38 +35,47 @@ class PBRTCPClient:
             self.socket.close()
             self.socket = None
 
+    def _recv_exact(self, n):
+        """Receive exactly n bytes, or None if the connection closed."""
+        data = b''
+        while len(data) < n:
+            chunk = self.socket.recv(n - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
     def send_command(self, command):
         if not self.socket:
             logger.error("Not connected to server")
             return {"success": False, "error": "Not connected to PBR Generator server"}
 
         try:
-            # The PBR server expects a JSON string followed by a newline
-            self.socket.sendall((json.dumps(command) + '\n').encode('utf-8'))
+            # The PBR server speaks length-prefixed frames: a 4-byte
+            # big-endian payload size followed by the JSON payload
+            payload = json.dumps(command).encode('utf-8')
+            self.socket.sendall(struct.pack('>I', len(payload)) + payload)
 
-            # Receive the response
-            response_data = b''
+            # Receive the framed response
             self.socket.settimeout(300)  # 5 minute timeout for PBR generation (it can take time)
-            while True:
-                chunk = self.socket.recv(4096)
-                if not chunk:
-                    break
-                response_data += chunk
-                # The PBR server sends a single JSON object, so we can try to parse it
-                try:
-                    return json.loads(response_data.decode('utf-8'))
-                except json.JSONDecodeError:
-                    # Not a complete JSON object yet, continue receiving
-                    continue
-            # If the loop breaks and we have no data, it's an issue.
-            if not response_data:
+            header = self._recv_exact(4)
+            if header is None:
+                self.disconnect()
                 return {"success": False, "error": "Received no data from PBR Generator server"}
+            (length,) = struct.unpack('>I', header)
+            response_data = self._recv_exact(length)
+            if response_data is None:
+                self.disconnect()
+                return {"success": False, "error": "Connection closed mid-response by PBR Generator server"}
             return json.loads(response_data.decode('utf-8'))
 
         except socket.timeout:
+            # The stream may be mid-frame; drop it rather than desync
+            self.disconnect()
             return {"success": False, "error": "Socket timeout while communicating with PBR Generator"}
         except Exception as e:
             logger.error(f"Error sending/receiving command: {e}")
+            self.disconnect()
             return {"success": False, "error": f"An unexpected error occurred: {e}"}
 
 def main():
@@ -73,6 +83,10 @@ def main():
     pbr_host = os.environ.get("PBR_HOST", "localhost")
     pbr_port = os.environ.get("PBR_PORT", 9878)
 
+    # One connection for the lifetime of the bridge; reconnected on
+    # demand instead of paying a TCP handshake per request
+    client = PBRTCPClient(pbr_host, pbr_port)
+
     for line in sys.stdin:
         try:
             request = json.loads(line)
@@ -86,12 +100,14 @@ def main():
                 "params": params
             }
 
-            client = PBRTCPClient(pbr_host, pbr_port)
             response = {}
-            if client.connect():
+            if client.socket is not None or client.connect():
                 result = client.send_command(pbr_command)
+                if client.socket is None and client.connect():
+                    # The idle connection had dropped (server restart);
+                    # retry once on a fresh one
+                    result = client.send_command(pbr_command)
                 response['result'] = result
-                client.disconnect()
             else:
                 response['error'] = f"Failed to connect to PBR Generator at {pbr_host}:{pbr_port}"
 
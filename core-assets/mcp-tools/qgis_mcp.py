@@ -9,6 +9,28 @@ import socket
 import os
 import logging
 
+# Prefer orjson for the per-request encode/decode; fall back to stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON from a str or bytes line, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 bytes, ready to write to the transport."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # Set up basic logging to stderr
 logging.basicConfig(level=logging.INFO, stream=sys.stderr, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("QgisMCPClient")
@@ -41,7 +63,7 @@ class QgisTCPClient:
 
         try:
             # The QGIS plugin expects a JSON string followed by a newline
-            self.socket.sendall((json.dumps(command) + '\n').encode('utf-8'))
+            self.socket.sendall(_json_dumps(command) + b'\n')
 
             # Receive the response
             response_data = b''
@@ -51,16 +73,21 @@ class QgisTCPClient:
                 if not chunk:
                     break
                 response_data += chunk
-                # The QGIS plugin sends a single JSON object, so we can try to parse it
+                # The QGIS plugin sends a single JSON object. Parsing the
+                # growing buffer after every chunk is quadratic for large
+                # responses, so only attempt it when the data can plausibly
+                # be complete (a top-level object must end with '}')
+                if not response_data.rstrip().endswith(b'}'):
+                    continue
                 try:
-                    return json.loads(response_data.decode('utf-8'))
-                except json.JSONDecodeError:
-                    # Not a complete JSON object yet, continue receiving
+                    return _json_loads(response_data)
+                except ValueError:
+                    # A '}' inside a string fooled the guard; keep receiving
                     continue
             # If the loop breaks and we have no data, it's an issue.
             if not response_data:
                 return {"success": False, "error": "Received no data from QGIS server"}
-            return json.loads(response_data.decode('utf-8'))
+            return _json_loads(response_data)
 
         except socket.timeout:
             return {"success": False, "error": "Socket timeout while communicating with QGIS"}
@@ -75,7 +102,7 @@ def main():
 
     for line in sys.stdin:
         try:
-            request = json.loads(line)
+            request = _json_loads(line)
             # The actual tool call is nested inside the MCP request
             tool_name = request.get('tool')
             params = request.get('params', {})
@@ -95,17 +122,18 @@ def main():
             else:
                 response['error'] = f"Failed to connect to QGIS at {qgis_host}:{qgis_port}"
 
-            sys.stdout.write(json.dumps(response) + '\n')
-            sys.stdout.flush()
+            # Write raw bytes to skip the text-layer UTF-8 re-encode
+            sys.stdout.buffer.write(_json_dumps(response) + b'\n')
+            sys.stdout.buffer.flush()
 
-        except json.JSONDecodeError:
+        except ValueError:
             error_response = {"error": "Invalid JSON received"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
         except Exception as e:
             error_response = {"error": f"An unexpected error occurred in the QGIS tool bridge: {e}"}
-            sys.stdout.write(json.dumps(error_response) + '\n')
-            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps(error_response) + b'\n')
+            sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
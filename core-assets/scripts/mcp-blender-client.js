@@ -10,10 +10,19 @@ const BLENDER_PORT = parseInt(process.env.BLENDER_PORT || 9876);
 const CONNECTION_TIMEOUT = 10000; // 10 seconds
 const RESPONSE_TIMEOUT = 60000; // 60 seconds
 
+// The Blender plugin speaks length-prefixed frames: a 4-byte big-endian
+// payload size followed by the JSON payload, in both directions.
+function frameMessage(obj) {
+    const payload = Buffer.from(JSON.stringify(obj), 'utf8');
+    const header = Buffer.alloc(4);
+    header.writeUInt32BE(payload.length, 0);
+    return Buffer.concat([header, payload]);
+}
+
 async function sendToBlender(command) {
     return new Promise((resolve, reject) => {
         const client = new net.Socket();
-        let responseData = '';
+        let responseData = Buffer.alloc(0);
         let connectionTimeout, responseTimeout;
 
         const cleanup = () => {
@@ -29,8 +38,7 @@ async function sendToBlender(command) {
 
         client.connect(BLENDER_PORT, BLENDER_HOST, () => {
             clearTimeout(connectionTimeout); // Connected successfully
-            // The Blender plugin expects a raw JSON object, no newline
-            client.write(JSON.stringify(command));
+            client.write(frameMessage(command));
 
             responseTimeout = setTimeout(() => {
                 cleanup();
@@ -39,14 +47,18 @@ async function sendToBlender(command) {
         });
 
         client.on('data', (data) => {
-            responseData += data.toString();
-            // The Blender plugin sends a single JSON response. Try to parse it.
+            responseData = Buffer.concat([responseData, data]);
+            // Wait for the full frame before parsing.
+            if (responseData.length < 4) return;
+            const length = responseData.readUInt32BE(0);
+            if (responseData.length < 4 + length) return;
             try {
-                const response = JSON.parse(responseData);
+                const response = JSON.parse(responseData.subarray(4, 4 + length).toString('utf8'));
                 cleanup();
                 resolve(response);
             } catch (e) {
-                // Incomplete data, wait for more.
+                cleanup();
+                reject(new Error(`Invalid JSON response from Blender: ${e.message}`));
             }
         });
 
@@ -57,17 +69,9 @@ async function sendToBlender(command) {
 
         client.on('close', () => {
             cleanup();
-            // If we have partial data, try to parse it, otherwise reject.
-            if (responseData) {
-                try {
-                    resolve(JSON.parse(responseData));
-                } catch (e) {
-                    reject(new Error(`Connection closed with incomplete JSON response: ${responseData}`));
-                }
-            } else {
-                // This case is handled by timeouts or error events, but as a fallback.
-                reject(new Error('Connection closed without a response.'));
-            }
+            // Complete frames are handled in the data handler; reaching
+            // this point means the connection dropped mid-response.
+            reject(new Error('Connection closed without a complete response.'));
         });
     });
 }
@@ -12,6 +12,15 @@ const PORT = process.env.MCP_BRIDGE_PORT || 3002;
 const HOST = '0.0.0.0'; // Listen on all network interfaces
 const MAX_CONNECTIONS = parseInt(process.env.WS_MAX_CONNECTIONS || '100');
 
+// Environment for spawned claude-flow processes, built once instead of
+// copying process.env on every connection
+const MCP_ENV = {
+    ...process.env,
+    CLAUDE_FLOW_DIRECT_MODE: 'true',
+    CLAUDE_FLOW_GLOBAL: 'true',
+    CLAUDE_FLOW_DATABASE: '/workspace/.swarm/memory.db'
+};
+
 // Initialize authentication middleware
 const auth = new AuthMiddleware();
 const activeConnections = new Map();
@@ -75,20 +84,41 @@ wss.on('connection', (ws, req) => {
     const mcpProcess = spawn('/usr/bin/claude-flow', ['mcp', 'start', '--stdio', '--file', '/workspace/.mcp.json'], {
         cwd: '/workspace', // Run in the context of the user's workspace
         stdio: ['pipe', 'pipe', 'pipe'], // stdin, stdout, stderr
-        env: {
-            ...process.env,
-            CLAUDE_FLOW_DIRECT_MODE: 'true',
-            CLAUDE_FLOW_GLOBAL: 'true',
-            CLAUDE_FLOW_DATABASE: '/workspace/.swarm/memory.db'
-        }
+        env: MCP_ENV
     });
 
     console.log(`[MCP Bridge] Spawned claude-flow MCP process with PID: ${mcpProcess.pid}`);
 
-    // Pipe data from the claude-flow process's stdout to the WebSocket client
-    mcpProcess.stdout.on('data', (data) => {
+    // Pipe data from the claude-flow process's stdout to the WebSocket client.
+    // Chunks arriving within the same event-loop tick are coalesced into a
+    // single send, so bursty MCP output costs one frame instead of one per chunk.
+    // When the client reads slower than claude-flow writes, the stdout pipe is
+    // paused instead of letting unsent frames pile up in ws.bufferedAmount.
+    const WS_HIGH_WATER = 1024 * 1024; // 1 MiB of unsent data
+    let pendingOut = [];
+    let flushScheduled = false;
+    const flushOut = () => {
+        flushScheduled = false;
+        if (pendingOut.length === 0) return;
+        const batch = Buffer.concat(pendingOut).toString();
+        pendingOut = [];
         if (ws.readyState === WebSocket.OPEN) {
-            ws.send(data.toString());
+            ws.send(batch, () => {
+                // This frame reached the socket; resume if we had paused
+                if (mcpProcess.stdout.isPaused() && ws.bufferedAmount < WS_HIGH_WATER) {
+                    mcpProcess.stdout.resume();
+                }
+            });
+            if (ws.bufferedAmount > WS_HIGH_WATER) {
+                mcpProcess.stdout.pause();
+            }
+        }
+    };
+    mcpProcess.stdout.on('data', (data) => {
+        pendingOut.push(data);
+        if (!flushScheduled) {
+            flushScheduled = true;
+            setImmediate(flushOut);
         }
     });
 
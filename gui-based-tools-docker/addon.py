@@ -1,11 +1,15 @@
 # Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
 
+import asyncio
+import base64
 import bpy
 import mathutils
+import numpy as np
 import json
+import queue
+import struct
 import threading
 import socket
-import time
 import requests
 import tempfile
 import traceback
@@ -13,9 +17,67 @@ import os
 import shutil
 import zipfile
 from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty
+from bpy.app.handlers import persistent
 import io
+import functools
 from contextlib import redirect_stdout, suppress
 
+# orjson is considerably faster than the stdlib json for the per-request
+# encode/decode in the server hot path; fall back to stdlib when missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pybase64 uses SIMD (libbase64) and is several times faster than the
+# stdlib encoder on the multi-megabyte screenshot payloads.
+try:
+    import pybase64
+    _b64encode = pybase64.b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
+
+def _json_loads(data):
+    """Parse JSON from bytes (or str), using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode('utf-8')
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize to UTF-8 bytes, ready to send on a socket."""
+    if orjson is not None:
+        # OPT_SERIALIZE_NUMPY handles numpy scalars/arrays coming from
+        # Blender vector conversions without an intermediate Python list
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+def frame_message(payload):
+    """Prefix a serialized message with its 4-byte big-endian length."""
+    return struct.pack('>I', len(payload)) + payload
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_code(code):
+    """Compile an execute_code payload, caching the code object.
+
+    MCP workflows frequently re-send the same automation script;
+    caching skips the parse/compile pass on repeat submissions.
+    """
+    return compile(code, '<mcp>', 'exec')
+
+
+@persistent
+def _mark_scene_dirty(scene, depsgraph=None):
+    """Depsgraph handler: invalidate the cached scene info on any update."""
+    server = getattr(bpy.types, "blendermcp_server", None)
+    if server is not None:
+        server._scene_dirty = True
+
 bl_info = {
     "name": "Blender MCP",
     "author": "BlenderMCP",
@@ -29,12 +91,24 @@ bl_info = {
 RODIN_FREE_TRIAL_KEY = "k9TcfFoEhNd9cCPP2guHAHHHkctZHIRhZDywZ1euGUXwihbYLpOjQhofby80NJez"
 
 class BlenderMCPServer:
+    # How often the main-thread timer polls for queued commands
+    JOB_POLL_INTERVAL = 0.01
+
     def __init__(self, host='localhost', port=9876):
         self.host = host
         self.port = port
         self.running = False
         self.socket = None
         self.server_thread = None
+        # Event loop owned by the server thread
+        self.loop = None
+        # Pending (command, future) jobs for the main thread
+        self.job_queue = queue.Queue()
+        # Cached get_scene_info result, invalidated by depsgraph updates
+        self._scene_info_cache = None
+        self._scene_dirty = True
+        # Set on the server loop by stop() to end _serve immediately
+        self._shutdown_event = None
 
     def start(self):
         if self.running:
@@ -47,8 +121,21 @@ class BlenderMCPServer:
             # Create socket
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                # Lets a restarted server rebind the port immediately
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             self.socket.bind((self.host, self.port))
-            self.socket.listen(1)
+            # Full kernel accept queue, so bursts of connecting MCP tools
+            # are not refused
+            self.socket.listen(socket.SOMAXCONN)
+
+            # One persistent timer drains all queued commands on the main
+            # thread, instead of registering a new timer per request
+            bpy.app.timers.register(self._drain_jobs, persistent=True)
+
+            # Invalidate the scene-info cache whenever the scene changes
+            if _mark_scene_dirty not in bpy.app.handlers.depsgraph_update_post:
+                bpy.app.handlers.depsgraph_update_post.append(_mark_scene_dirty)
 
             # Start server thread
             self.server_thread = threading.Thread(target=self._server_loop)
@@ -63,6 +150,31 @@ class BlenderMCPServer:
     def stop(self):
         self.running = False
 
+        # Remove the command-drain timer (it also unregisters itself by
+        # returning None once self.running is False)
+        try:
+            if bpy.app.timers.is_registered(self._drain_jobs):
+                bpy.app.timers.unregister(self._drain_jobs)
+        except Exception:
+            pass
+
+        # Remove the scene-info cache invalidation handler
+        try:
+            if _mark_scene_dirty in bpy.app.handlers.depsgraph_update_post:
+                bpy.app.handlers.depsgraph_update_post.remove(_mark_scene_dirty)
+        except Exception:
+            pass
+
+        # Signal _serve to return; the event keeps the idle loop fully
+        # parked instead of waking it to poll a flag
+        loop = self.loop
+        event = self._shutdown_event
+        if loop is not None and event is not None:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass
+
         # Close socket
         if self.socket:
             try:
@@ -83,98 +195,129 @@ class BlenderMCPServer:
         print("BlenderMCP server stopped")
 
     def _server_loop(self):
-        """Main server loop in a separate thread"""
-        print("Server thread started")
-        self.socket.settimeout(1.0)  # Timeout to allow for stopping
-
-        while self.running:
-            try:
-                # Accept new connection
-                try:
-                    client, address = self.socket.accept()
-                    print(f"Connected to client: {address}")
-
-                    # Handle client in a separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client,
-                        args=(client,)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                except socket.timeout:
-                    # Just check running condition
-                    continue
-                except Exception as e:
-                    print(f"Error accepting connection: {str(e)}")
-                    time.sleep(0.5)
-            except Exception as e:
-                print(f"Error in server loop: {str(e)}")
-                if not self.running:
-                    break
-                time.sleep(0.5)
+        """Run the asyncio server on the dedicated server thread.
 
+        Each client is one coroutine on this loop rather than one OS
+        thread, so many concurrent MCP connections add no threads and
+        no per-client stacks.
+        """
+        print("Server thread started")
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._serve())
+        except Exception as e:
+            print(f"Error in server loop: {str(e)}")
+        finally:
+            self.loop.close()
+            self.loop = None
         print("Server thread stopped")
 
-    def _handle_client(self, client):
-        """Handle connected client"""
-        print("Client handler started")
-        client.settimeout(None)  # No timeout
-        buffer = b''
+    async def _serve(self):
+        """Accept clients on the already-bound listen socket."""
+        server = await asyncio.start_server(self._handle_client, sock=self.socket)
+        async with server:
+            # Block until stop() sets the event; no periodic wakeups
+            # while the server is idle
+            self._shutdown_event = asyncio.Event()
+            await self._shutdown_event.wait()
+
+    async def _handle_client(self, reader, writer):
+        """Handle connected client.
+
+        Messages are length-prefixed frames: a 4-byte big-endian payload
+        size followed by the JSON payload. This handles requests of any
+        size (e.g. large execute_code payloads) without guessing message
+        boundaries from the byte stream.
+        """
+        address = writer.get_extra_info('peername')
+        print(f"Connected to client: {address}")
+
+        # Disable Nagle's algorithm - responses are small JSON payloads
+        # and latency matters more than packet count
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
         try:
             while self.running:
-                # Receive data
+                # Receive one framed request
                 try:
-                    data = client.recv(8192)
-                    if not data:
-                        print("Client disconnected")
-                        break
+                    header = await reader.readexactly(4)
+                    (length,) = struct.unpack('>I', header)
+                    payload = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
+                    print("Client disconnected")
+                    break
 
-                    buffer += data
-                    try:
-                        # Try to parse command
-                        command = json.loads(buffer.decode('utf-8'))
-                        buffer = b''
+                try:
+                    command = _json_loads(payload)
+                except ValueError:
+                    writer.write(frame_message(_json_dumps(
+                        {"status": "error", "message": "Invalid JSON received"})))
+                    await writer.drain()
+                    continue
 
-                        # Execute command in Blender's main thread
-                        def execute_wrapper():
-                            try:
-                                response = self.execute_command(command)
-                                response_json = json.dumps(response)
-                                try:
-                                    client.sendall(response_json.encode('utf-8'))
-                                except:
-                                    print("Failed to send response - client disconnected")
-                            except Exception as e:
-                                print(f"Error executing command: {str(e)}")
-                                traceback.print_exc()
-                                try:
-                                    error_response = {
-                                        "status": "error",
-                                        "message": str(e)
-                                    }
-                                    client.sendall(json.dumps(error_response).encode('utf-8'))
-                                except:
-                                    pass
-                            return None
-
-                        # Schedule execution in main thread
-                        bpy.app.timers.register(execute_wrapper, first_interval=0.0)
-                    except json.JSONDecodeError:
-                        # Incomplete data, wait for more
-                        pass
-                except Exception as e:
-                    print(f"Error receiving data: {str(e)}")
+                # Queue the command for the main thread; the persistent
+                # drain timer resolves the future via the event loop
+                future = asyncio.get_running_loop().create_future()
+                self.job_queue.put((command, future))
+
+                try:
+                    response = await asyncio.wait_for(future, timeout=30)
+                except asyncio.TimeoutError:
+                    response = {"status": "error", "message": "Command timed out"}
+
+                try:
+                    writer.write(frame_message(_json_dumps(response)))
+                    await writer.drain()
+                except Exception:
+                    print("Failed to send response - client disconnected")
                     break
         except Exception as e:
             print(f"Error in client handler: {str(e)}")
         finally:
-            try:
-                client.close()
-            except:
-                pass
+            writer.close()
+            with suppress(Exception):
+                await writer.wait_closed()
             print("Client handler stopped")
 
+    @staticmethod
+    def _resolve_job(future, response):
+        """Complete a client's future; runs on the server event loop."""
+        if not future.done():
+            future.set_result(response)
+
+    def _drain_jobs(self):
+        """Timer callback on Blender's main thread: run all queued commands.
+
+        A single always-registered timer replaces the per-request
+        bpy.app.timers.register calls, so N concurrent clients share one
+        timer instead of each adding their own to Blender's event loop.
+        """
+        while True:
+            try:
+                command, future = self.job_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                response = self.execute_command(command)
+            except Exception as e:
+                print(f"Error executing command: {str(e)}")
+                traceback.print_exc()
+                response = {"status": "error", "message": str(e)}
+
+            # Hand the result back to the client coroutine on its loop
+            loop = self.loop
+            if loop is not None:
+                try:
+                    loop.call_soon_threadsafe(self._resolve_job, future, response)
+                except RuntimeError:
+                    pass  # Loop already closed during shutdown
+
+        # Returning None unregisters the timer once the server stops
+        return self.JOB_POLL_INTERVAL if self.running else None
+
     def execute_command(self, command):
         """Execute a command in the main Blender thread"""
         try:
@@ -251,6 +394,11 @@ class BlenderMCPServer:
     def get_scene_info(self):
         """Get information about the current Blender scene"""
         try:
+            # Serve from cache while the scene is unchanged; polling
+            # clients otherwise re-walk every object on each call
+            if not self._scene_dirty and self._scene_info_cache is not None:
+                return self._scene_info_cache
+
             print("Getting scene info...")
             # Simplify the scene info to reduce data size
             scene_info = {
@@ -261,21 +409,38 @@ class BlenderMCPServer:
             }
 
             # Collect minimal object information (limit to first 10 objects)
-            for i, obj in enumerate(bpy.context.scene.objects):
-                if i >= 10:  # Reduced from 20 to 10
-                    break
+            objects = bpy.context.scene.objects
+            count = min(len(objects), 10)  # Reduced from 20 to 10
+
+            try:
+                # foreach_get copies all locations in one C call instead
+                # of one RNA attribute access per object per component
+                locations = np.empty(len(objects) * 3, dtype=np.float32)
+                objects.foreach_get('location', locations)
+                locations = locations.reshape(-1, 3)
+            except (AttributeError, RuntimeError):
+                locations = None
+
+            for i in range(count):
+                obj = objects[i]
+                if locations is not None:
+                    loc = locations[i]
+                else:
+                    loc = obj.location
 
                 obj_info = {
                     "name": obj.name,
                     "type": obj.type,
                     # Only include basic location data
-                    "location": [round(float(obj.location.x), 2),
-                                round(float(obj.location.y), 2),
-                                round(float(obj.location.z), 2)],
+                    "location": [round(float(loc[0]), 2),
+                                round(float(loc[1]), 2),
+                                round(float(loc[2]), 2)],
                 }
                 scene_info["objects"].append(obj_info)
 
             print(f"Scene info collected: {len(scene_info['objects'])} objects")
+            self._scene_info_cache = scene_info
+            self._scene_dirty = False
             return scene_info
         except Exception as e:
             print(f"Error in get_scene_info: {str(e)}")
@@ -343,18 +508,26 @@ class BlenderMCPServer:
 
     def get_viewport_screenshot(self, max_size=800, filepath=None, format="png"):
         """
-        Capture a screenshot of the current 3D viewport and save it to the specified path.
+        Capture a screenshot of the current 3D viewport.
 
         Parameters:
         - max_size: Maximum size in pixels for the largest dimension of the image
-        - filepath: Path where to save the screenshot file
+        - filepath: Optional path where to save the screenshot file. When
+          omitted, the image bytes are returned inline as base64 instead of
+          being left on disk for the client to pick up - no shared
+          filesystem needed.
         - format: Image format (png, jpg, etc.)
 
         Returns success/error status
         """
+        # The screenshot operator can only write to a file, so inline
+        # capture goes through a private temporary file that is read
+        # back and removed before returning.
+        return_data = not filepath
         try:
-            if not filepath:
-                return {"error": "No filepath provided"}
+            if return_data:
+                fd, filepath = tempfile.mkstemp(suffix=f".{format}")
+                os.close(fd)
 
             # Find the active 3D viewport
             area = None
@@ -388,14 +561,27 @@ class BlenderMCPServer:
             # Cleanup Blender image data
             bpy.data.images.remove(img)
 
-            return {
+            result = {
                 "success": True,
                 "width": width,
                 "height": height,
-                "filepath": filepath
             }
 
+            if return_data:
+                with open(filepath, 'rb') as f:
+                    image_data = f.read()
+                os.unlink(filepath)
+                result["format"] = format
+                result["data"] = _b64encode(image_data).decode('ascii')
+            else:
+                result["filepath"] = filepath
+
+            return result
+
         except Exception as e:
+            if return_data and filepath:
+                with suppress(Exception):
+                    os.unlink(filepath)
             return {"error": str(e)}
 
     def execute_code(self, code):
@@ -408,7 +594,7 @@ class BlenderMCPServer:
             # Capture stdout during execution, and return it as result
             capture_buffer = io.StringIO()
             with redirect_stdout(capture_buffer):
-                exec(code, namespace)
+                exec(_compile_code(code), namespace)
 
             captured_output = capture_buffer.getvalue()
             return {"executed": True, "result": captured_output}
@@ -11,8 +11,12 @@ def start_job():
         bpy.ops.preferences.addon_enable(module='addon')
         print("MCP AUTOSTART: Addon enabled.")
 
-        # A small delay to ensure the operator is fully registered after enabling the addon
-        time.sleep(1)
+        # Poll until the operator is registered instead of sleeping a
+        # fixed second; registration usually completes within a few ms
+        for _ in range(100):
+            if 'start_server' in dir(bpy.ops.blendermcp):
+                break
+            time.sleep(0.01)
 
         print("MCP AUTOSTART: Calling operator to start server...")
         bpy.ops.blendermcp.start_server()
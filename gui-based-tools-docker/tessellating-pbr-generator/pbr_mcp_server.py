@@ -5,8 +5,14 @@ Listens on TCP port 9878 and responds to MCP requests.
 """
 
 import asyncio
+import concurrent.futures
+import copy
+import functools
+import hashlib
 import json
+import multiprocessing
 import socket
+import struct
 import sys
 import os
 import time
@@ -14,6 +20,32 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Prefer orjson for the per-request encode/decode; fall back to stdlib.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# uvloop replaces the default selector event loop with libuv; optional.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _json_loads(data):
+    """Parse JSON from bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 bytes, ready to write to the transport."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 # Add the src directory to the Python path for imports
 sys.path.insert(0, '/opt/tessellating-pbr-generator/src')
 sys.path.insert(0, '/opt/tessellating-pbr-generator')
@@ -27,44 +59,90 @@ from src.utils.logging import setup_logger, get_logger
 setup_logger(debug=False, verbose=False, no_color=True)
 logger = get_logger(__name__)
 
+# Texture generation is CPU-bound (convolutions, normal-map derivation),
+# so it runs in worker processes to keep the event loop free for other
+# clients. The pool is created on first use.
+_generation_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+
+def _get_generation_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _generation_pool
+    if _generation_pool is None:
+        _generation_pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count()
+        )
+    return _generation_pool
+
+
+def _generate_textures_sync(config: Config):
+    """Run the async generation pipeline to completion in a worker process."""
+    return asyncio.run(generate_textures(config))
+
+
+def _cache_key(params: Dict[str, Any]) -> str:
+    """Content hash of the generation parameters, ignoring cache control."""
+    relevant = {k: v for k, v in params.items() if k != 'no_cache'}
+    return hashlib.blake2b(
+        json.dumps(relevant, sort_keys=True).encode('utf-8')
+    ).hexdigest()
+
+
+@functools.lru_cache(maxsize=16)
+def _load_base_config(path: str, mtime: float) -> dict:
+    """Load a config file, cached by path and modification time.
+
+    The mtime key makes edits to the file invalidate the cached entry.
+    Callers must deepcopy the result before mutating it.
+    """
+    return load_config(path)
+
 class PBRGeneratorServer:
     def __init__(self, host='0.0.0.0', port=9878):
         self.host = host
         self.port = port
         self.server = None
+        # Output directories already created by this process, so repeat
+        # requests skip the mkdir syscall
+        self._created_dirs = set()
 
     async def handle_client(self, reader, writer):
         """Handle incoming client connections."""
         client_addr = writer.get_extra_info('peername')
         logger.info(f"Client connected from {client_addr}")
+
+        # Disable Nagle's algorithm so small JSON responses are not delayed
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         
         try:
             while True:
-                # Read the JSON request
-                data = await reader.readline()
-                if not data:
+                # Read one length-prefixed frame: a 4-byte big-endian
+                # payload size followed by the JSON payload
+                try:
+                    header = await reader.readexactly(4)
+                    (length,) = struct.unpack('>I', header)
+                    data = await reader.readexactly(length)
+                except asyncio.IncompleteReadError:
                     break
-                
+
                 try:
-                    request = json.loads(data.decode('utf-8').strip())
+                    request = _json_loads(data)
                     logger.info(f"Received request: {request.get('tool', 'unknown')}")
-                    
+
                     # Process the request
                     response = await self.process_request(request)
-                    
+
                     # Send the response
-                    response_json = json.dumps(response) + '\n'
-                    writer.write(response_json.encode('utf-8'))
+                    self._send_frame(writer, response)
                     await writer.drain()
-                    
-                except json.JSONDecodeError:
-                    error_response = {"error": "Invalid JSON received"}
-                    writer.write((json.dumps(error_response) + '\n').encode('utf-8'))
+
+                except ValueError:
+                    self._send_frame(writer, {"error": "Invalid JSON received"})
                     await writer.drain()
                 except Exception as e:
                     logger.error(f"Error processing request: {e}")
-                    error_response = {"error": f"Internal server error: {str(e)}"}
-                    writer.write((json.dumps(error_response) + '\n').encode('utf-8'))
+                    self._send_frame(writer, {"error": f"Internal server error: {str(e)}"})
                     await writer.drain()
                     
         except asyncio.CancelledError:
@@ -76,6 +154,14 @@ class PBRGeneratorServer:
             await writer.wait_closed()
             logger.info(f"Client {client_addr} disconnected")
 
+    @staticmethod
+    def _send_frame(writer, response: Dict[str, Any]):
+        """Write a response as a length-prefixed frame."""
+        payload = _json_dumps(response)
+        # Gather write: queues header and payload without concatenating
+        # them into a third buffer first
+        writer.writelines([struct.pack('>I', len(payload)), payload])
+
     async def process_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Process an MCP request and return a response."""
         tool = request.get('tool')
@@ -99,9 +185,12 @@ class PBRGeneratorServer:
             # Set up default config path
             config_path = params.get('config') or '/opt/tessellating-pbr-generator/config/default.json'
             
-            # Load base configuration
+            # Load base configuration (cached; reloaded when the file's
+            # mtime changes). Deepcopy before the overrides below so the
+            # cached dict stays pristine.
             try:
-                config_dict = load_config(config_path)
+                mtime = os.stat(config_path).st_mtime
+                config_dict = copy.deepcopy(_load_base_config(config_path, mtime))
             except Exception as e:
                 logger.error(f"Failed to load config: {e}")
                 return {"success": False, "error": f"Failed to load configuration: {str(e)}"}
@@ -122,9 +211,26 @@ class PBRGeneratorServer:
             # Handle output directory
             output_dir = params.get('output', '/workspace/pbr_outputs')
             config_dict["output"]["directory"] = output_dir
+
+            # Generation is deterministic for a given set of params, so
+            # serve a previous result when its files are still on disk.
+            # Pass no_cache=true to force regeneration.
+            cache_dir = Path(output_dir) / '.cache' / _cache_key(params)
+            manifest_path = cache_dir / 'manifest.json'
+            if not params.get('no_cache') and manifest_path.exists():
+                try:
+                    manifest = _json_loads(manifest_path.read_bytes())
+                    if all(os.path.exists(p) for p in manifest.get('generated_files', [])):
+                        logger.info(f"Serving cached result for material: {material}")
+                        manifest['cached'] = True
+                        return manifest
+                except (ValueError, OSError) as e:
+                    logger.warning(f"Ignoring unreadable cache entry: {e}")
             
-            # Ensure output directory exists
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            # Ensure output directory exists (once per directory)
+            if output_dir not in self._created_dirs:
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(output_dir)
 
             # Handle texture types
             if 'types' in params:
@@ -141,8 +247,12 @@ class PBRGeneratorServer:
             logger.info(f"Resolution: {config.texture_config.resolution.width}x{config.texture_config.resolution.height}")
             logger.info(f"Output directory: {config.output_directory}")
 
-            # Generate textures
-            results = await generate_textures(config)
+            # Generate textures in a worker process so the event loop
+            # stays responsive while the CPU-bound pipeline runs
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(
+                _get_generation_pool(), _generate_textures_sync, config
+            )
             
             # Build response
             generation_time = time.time() - start_time
@@ -163,13 +273,21 @@ class PBRGeneratorServer:
                 }
 
             if successful_results:
-                return {
+                response = {
                     "success": True,
                     "generation_time": generation_time,
                     "generated_files": generated_files,
                     "texture_results": texture_results,
                     "summary": f"Generated {len(successful_results)}/{len(results)} textures successfully"
                 }
+                # Record the result so identical params can skip
+                # generation next time
+                try:
+                    cache_dir.mkdir(parents=True, exist_ok=True)
+                    manifest_path.write_bytes(_json_dumps(response))
+                except OSError as e:
+                    logger.warning(f"Failed to write result cache: {e}")
+                return response
             else:
                 # All failed
                 error_messages = [r.error_message for r in failed_results if r.error_message]
@@ -191,10 +309,17 @@ class PBRGeneratorServer:
     async def start_server(self):
         """Start the TCP server."""
         try:
+            server_kwargs = {}
+            if hasattr(socket, 'SO_REUSEPORT'):
+                # Lets multiple worker processes bind the same port; the
+                # kernel load-balances accepted connections between them
+                server_kwargs['reuse_port'] = True
+
             self.server = await asyncio.start_server(
-                self.handle_client, 
-                self.host, 
-                self.port
+                self.handle_client,
+                self.host,
+                self.port,
+                **server_kwargs
             )
             
             logger.info(f"PBR Generator MCP Server started on {self.host}:{self.port}")
@@ -226,5 +351,18 @@ async def main():
     finally:
         await server.stop_server()
 
+def run_worker():
+    """Run one server process on its own event loop."""
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(main())
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # One worker per two cores by default; override with PBR_WORKERS.
+    # Extra workers share the port via SO_REUSEPORT, so they are only
+    # spawned where that option exists.
+    workers = int(os.environ.get('PBR_WORKERS', max(1, (os.cpu_count() or 2) // 2)))
+    if workers > 1 and hasattr(socket, 'SO_REUSEPORT'):
+        for _ in range(workers - 1):
+            multiprocessing.Process(target=run_worker, daemon=True).start()
+    run_worker()
\ No newline at end of file